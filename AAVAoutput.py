@@ -1,17 +1,26 @@
+import os
+from collections import namedtuple
+
 import pytest
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
+# WebDriverWait and expected_conditions pull in the whole remote WebDriver stack
+# (~0.35s), so they are imported where used to keep test collection fast.
+
+# Jira site and credentials, resolved once from the environment; the defaults
+# are placeholders so the suite can be collected without any configuration
+JIRA_BASE_URL = os.environ.get("JIRA_BASE_URL", "https://nithyavakapatla.atlassian.net")
+JIRA_EMAIL = os.environ.get("JIRA_EMAIL", "user@example.com")
+JIRA_API_TOKEN = os.environ.get("JIRA_API_TOKEN", "JIRA_API_TOKEN")
 
 # Test data extracted from JSON input
 test_cases = [
     {
         "test_case": "TC01_Minimal_Story",
-        "base_url": "https://nithyavakapatla.atlassian.net",
-        "email": "user@example.com",
-        "api_key": "JIRA_API_TOKEN",
+        "priority": "high",
+        "base_url": JIRA_BASE_URL,
+        "email": JIRA_EMAIL,
+        "api_key": JIRA_API_TOKEN,
         "project_key": "AAVA",
         "issue_type": "Story",
         "summary": "Employee applies for leave",
@@ -20,9 +29,10 @@ test_cases = [
     },
     {
         "test_case": "TC02_Task",
-        "base_url": "https://nithyavakapatla.atlassian.net",
-        "email": "user@example.com",
-        "api_key": "JIRA_API_TOKEN",
+        "priority": "medium",
+        "base_url": JIRA_BASE_URL,
+        "email": JIRA_EMAIL,
+        "api_key": JIRA_API_TOKEN,
         "project_key": "AAVA",
         "issue_type": "Task",
         "summary": "Validate leave balance",
@@ -31,9 +41,10 @@ test_cases = [
     },
     {
         "test_case": "TC03_Bug",
-        "base_url": "https://nithyavakapatla.atlassian.net",
-        "email": "user@example.com",
-        "api_key": "JIRA_API_TOKEN",
+        "priority": "medium",
+        "base_url": JIRA_BASE_URL,
+        "email": JIRA_EMAIL,
+        "api_key": JIRA_API_TOKEN,
         "project_key": "AAVA",
         "issue_type": "Bug",
         "summary": "Leave request submission fails",
@@ -42,104 +53,355 @@ test_cases = [
     }
 ]
 
-@pytest.fixture(scope="function")
-def driver():
-    # Setup Chrome WebDriver
+# Locators shared by the login and issue-creation steps
+USERNAME_INPUT = (By.ID, "username")
+PASSWORD_INPUT = (By.ID, "password")
+LOGIN_SUBMIT = (By.ID, "login-submit")
+LOGIN_ERROR = (By.CSS_SELECTOR, "[data-testid='login-error']")
+GLOBAL_CREATE_BUTTON = (By.ID, "createGlobalItem")
+ISSUE_TYPE_SELECT = (By.ID, "issue-create.ui.modal.create-form.issue-type-select")
+PROJECT_SELECT = (By.ID, "issue-create.ui.modal.create-form.project-select")
+SUMMARY_FIELD = (By.ID, "summary-field")
+DESCRIPTION_FIELD = (By.ID, "description-field")
+CREATE_SUBMIT = (By.XPATH, "//button[@type='submit' and .='Create']")
+ISSUE_CREATED_BANNER = (By.CSS_SELECTOR, "div.jira-issue-created")
+# Dropdown options are matched on their text, which CSS selectors cannot do;
+# filling in the template lets the browser find the option in one lookup
+DROPDOWN_OPTION_XPATH = "//div[@role='option' and text()='{}']"
+
+# Resources the tests never look at: images, fonts, media and analytics beacons.
+# This is the only image blocking: unlike Chrome flags or prefs it also applies
+# to Grid and attached (REUSE_CHROME) browsers, since it is set over CDP.
+# CSS is left alone because clickability/visibility checks depend on layout;
+# the Google Fonts stylesheets only declare web fonts, so they can go too.
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.mp4", "*.webm",
+    "*fonts.googleapis.com*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*hotjar.com*", "*/gasv3/*",
+]
+
+def execute_cdp(browser, cmd, params):
+    """
+    Runs a Chrome DevTools Protocol command on a local or remote Chrome session.
+    Goes through the raw command because Remote drivers only gained
+    execute_cdp_cmd() in recent Selenium releases.
+    """
+    return browser.execute("executeCdpCommand", {"cmd": cmd, "params": params})["value"]
+
+def chrome_options(remote=False):
+    """
+    Builds the command-line options for a Chrome started by the tests.
+    Local-only settings (the profile directory) are left out for a remote Grid.
+    """
     options = webdriver.ChromeOptions()
-    options.add_argument("--headless")  # Optional: run in headless mode
-    driver = webdriver.Chrome(options=options)
-    driver.implicitly_wait(10)
-    yield driver
-    driver.quit()
-
-@pytest.mark.parametrize("case", test_cases, ids=[tc["test_case"] for tc in test_cases])
-def test_create_jira_issue(driver, case):
+    # New headless mode shares the regular rendering pipeline and starts faster
+    options.add_argument("--headless=new")  # Optional: run in headless mode
+    # Trim browser features the tests never use so startup and page loads are faster
+    for flag in ("--disable-gpu", "--no-sandbox", "--disable-dev-shm-usage",
+                 "--disable-extensions",
+                 "--disable-background-networking", "--disable-renderer-backgrounding",
+                 "--disable-default-apps", "--disable-sync", "--metrics-recording-only",
+                 "--mute-audio", "--no-first-run",
+                 "--disable-features=Translate,MediaRouter"):
+        options.add_argument(flag)
+    # Headless defaults to 800x600, which gets Jira's narrow layout; use a
+    # desktop-sized viewport so the navigation and Create dialog render as usual
+    options.add_argument("--window-size=1280,900")
+    # Opt-in persistent profile (CHROME_PROFILE_DIR) so Jira's static assets stay
+    # in the HTTP cache across runs. Chrome locks a profile to one process, so
+    # each xdist worker gets its own subdirectory; cookies and storage are still
+    # reset before the first login. Without it chromedriver uses a fresh temporary
+    # profile, so concurrent runs on one host never fight over the lock.
+    # A host path means nothing on a Grid node, and concurrent sessions there
+    # would share it, so remote browsers always get their own temporary profile
+    profile_dir = os.environ.get("CHROME_PROFILE_DIR")
+    if profile_dir and not remote:
+        worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        options.add_argument(f"--user-data-dir={os.path.join(profile_dir, worker_id)}")
+    return options
+
+@pytest.fixture(scope="session")
+def browser():
+    # Setup Chrome WebDriver once and share it across all test cases
+    remote_url = os.environ.get("SELENIUM_REMOTE_URL")
+    reuse_chrome = not remote_url and os.environ.get("REUSE_CHROME") == "1"
+    if reuse_chrome:
+        # Attach to a long-lived Chrome started with --remote-debugging-port
+        # instead of launching one; its flags were fixed when it was started
+        options = webdriver.ChromeOptions()
+        options.debugger_address = os.environ.get("CHROME_DEBUGGER_ADDRESS", "127.0.0.1:9222")
+    else:
+        options = chrome_options(remote=bool(remote_url))
+    # Return from driver.get() immediately; every navigation is followed by an
+    # explicit wait on the element the next step needs, so waiting for the
+    # page's own load (analytics, fonts, trackers) is pure overhead
+    options.page_load_strategy = "none"
+    if remote_url:
+        # Use an already running Selenium Grid / standalone Chrome container
+        # instead of starting chromedriver and Chrome locally
+        browser = webdriver.Remote(command_executor=remote_url, options=options)
+    else:
+        # Use a pinned chromedriver when one is provided; otherwise let Selenium
+        # Manager resolve it, caching downloads in the project so CI can persist them
+        chromedriver = os.environ.get("CHROMEDRIVER")
+        if chromedriver:
+            service = webdriver.ChromeService(executable_path=chromedriver)
+        else:
+            os.environ.setdefault("SE_CACHE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".selenium-cache"))
+            service = webdriver.ChromeService()
+        browser = webdriver.Chrome(options=options, service=service)
+    try:
+        execute_cdp(browser, "Network.enable", {})
+        execute_cdp(browser, "Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+        # No implicit wait: every lookup below is gated by an explicit WebDriverWait,
+        # and mixing the two makes each failed poll block for the implicit timeout.
+        # Set explicitly since an attached or remote session may not start at 0.
+        browser.implicitly_wait(0)
+        yield browser
+    finally:
+        # Runs even when the setup above fails, so a half-configured Chrome is not leaked
+        if reuse_chrome:
+            # Leave the long-lived Chrome running for the next run; only stop chromedriver
+            browser.service.stop()
+        else:
+            browser.quit()
+
+# Origins whose storage is wiped between test cases
+test_origins = sorted({tc["base_url"] for tc in test_cases})
+
+def reset_browser(browser):
+    """
+    Clears cookies and storage so the shared browser starts from a signed-out state.
+    """
+    # The CDP calls clear every cookie (including the id.atlassian.com login
+    # ones) in one command, unlike delete_all_cookies() which only sees the
+    # current domain and removes cookies one by one.
+    execute_cdp(browser, "Network.clearBrowserCookies", {})
+    for origin in test_origins:
+        execute_cdp(browser, "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+    # sessionStorage is per tab and not covered by CDP; it is not accessible on
+    # the initial data: URL, hence the guard
+    browser.execute_script("try { window.sessionStorage.clear(); } catch (e) {}")
+
+# Shared explicit waits: the default step wait, a short one for modal widgets
+# and a long one for the post-login dashboard.
+Waits = namedtuple("Waits", ["default", "short", "long"])
+
+@pytest.fixture(scope="session")
+def waits(browser, pytestconfig):
+    # Built once per session since the browser is shared. Poll every 100ms by
+    # default (--poll-frequency) rather than Selenium's 0.5s so elements are picked
+    # up sooner, and keep polling through lookups that miss or hit an element
+    # React just re-rendered.
+    from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    poll = pytestconfig.getoption("--poll-frequency")
+    ignored = (NoSuchElementException, StaleElementReferenceException)
+    return Waits(
+        default=WebDriverWait(browser, 20, poll_frequency=poll, ignored_exceptions=ignored),
+        short=WebDriverWait(browser, 10, poll_frequency=poll, ignored_exceptions=ignored),
+        long=WebDriverWait(browser, 30, poll_frequency=poll, ignored_exceptions=ignored),
+    )
+
+# Sets each (element, value) argument pair through the native value setter (so
+# React-controlled fields see the change) and fires input/change events; returns
+# the indexes of the pairs whose element is not an input/textarea.
+SET_VALUES_JS = """
+var skipped = [];
+for (var i = 0; i < arguments.length; i += 2) {
+    var el = arguments[i];
+    var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+              : el instanceof HTMLInputElement ? HTMLInputElement.prototype : null;
+    if (!proto) { skipped.push(i / 2); continue; }
+    Object.getOwnPropertyDescriptor(proto, "value").set.call(el, arguments[i + 1]);
+    el.dispatchEvent(new Event("input", {bubbles: true}));
+    el.dispatchEvent(new Event("change", {bubbles: true}));
+}
+return skipped;
+"""
+
+def set_field_values(driver, *fields):
+    """
+    Fills one or more text fields, given as (element, text) pairs, in a single
+    WebDriver command instead of clear() + send_keys() per field.
+    Falls back to real keystrokes for fields that are not plain inputs (e.g. rich-text editors).
+    """
+    for index in driver.execute_script(SET_VALUES_JS, *[arg for field in fields for arg in field]):
+        element, text = fields[index]
+        element.clear()
+        element.send_keys(text)
+
+FIND_VISIBLE_BY_IDS_JS = """
+return Array.prototype.map.call(arguments, function (id) {
+    var el = document.getElementById(id);
+    var shown = el && el.getClientRects().length > 0 && getComputedStyle(el).visibility !== "hidden";
+    return shown ? el : null;
+});
+"""
+
+def wait_for_visible_ids(wait, *element_ids):
+    """
+    Waits until the elements with the given ids are all present and visible and
+    returns them, checking every id with a single WebDriver command per poll.
+    """
+    def all_visible(driver):
+        elements = driver.execute_script(FIND_VISIBLE_BY_IDS_JS, *element_ids)
+        return elements if all(elements) else False
+    return wait.until(all_visible, f"Not all of these ids are visible: {', '.join(element_ids)}")
+
+def wait_for(wait, *locators, clickable=False, visible=False):
+    """
+    Waits for the element at locator to be present and returns it.
+    Pass clickable for elements about to be clicked and visible for elements
+    that are read or typed into, so the step does not fail on a hidden element.
+    Given several locators, returns the first element found for any of them.
+    """
+    EC = expected_conditions()
+    if clickable:
+        condition = EC.element_to_be_clickable
+    elif visible:
+        condition = EC.visibility_of_element_located
+    else:
+        condition = EC.presence_of_element_located
+    if len(locators) == 1:
+        return wait.until(condition(locators[0]))
+    return wait.until(EC.any_of(*[condition(locator) for locator in locators]))
+
+def wait_until_gone(wait, element):
+    """
+    Waits until element has been removed from the page (e.g. its dialog closed).
+    """
+    wait.until(expected_conditions().staleness_of(element))
+
+def log_in(driver, waits, case):
+    """
+    Signs in to Jira through the two-step Atlassian login form and returns once
+    the dashboard's Create button is present.
+    Fails as soon as the form reports an error instead of waiting out the dashboard wait.
+    """
+    # Navigate to Jira login page (returns immediately, see the page_load_strategy
+    # in the browser fixture; the wait below gates on the form)
+    driver.get(f"{case['base_url']}/login")
+
+    # Enter email and continue
+    # Wait for visibility, not presence: the JavaScript fill below would happily
+    # write into a field that is still hidden while the form switches steps
+    email_input = wait_for(waits.default, USERNAME_INPUT, visible=True)
+    set_field_values(driver, (email_input, case["email"]))
+    # The page may still be loading (page_load_strategy "none"), so wait until
+    # the button can take the click rather than just until it exists
+    wait_for(waits.default, LOGIN_SUBMIT, clickable=True).click()
+
+    # Enter API key as password
+    password_input = wait_for(waits.default, PASSWORD_INPUT, visible=True)
+    set_field_values(driver, (password_input, case["api_key"]))
+    wait_for(waits.default, LOGIN_SUBMIT, clickable=True).click()
+
+    # Either the dashboard loads or the form rejects the credentials
+    landed_on = wait_for(waits.long, GLOBAL_CREATE_BUTTON, LOGIN_ERROR)
+    if landed_on.get_attribute("id") != GLOBAL_CREATE_BUTTON[1]:
+        raise AssertionError(f"Login failed for {case['email']}: {landed_on.text}")
+
+# Signed-in landing page; it carries the global Create button
+DASHBOARD_PATH = "/jira/your-work"
+
+@pytest.fixture(scope="session")
+def signed_in_accounts():
+    # (base_url, email) pairs the shared browser is currently signed in as
+    return set()
+
+@pytest.fixture(scope="function")
+def logged_in_driver(browser, waits, signed_in_accounts, case):
+    """
+    Yields the shared browser signed in as the case's account, on the Jira dashboard.
+    Logs in only when the account differs from the previous case's; otherwise
+    the existing session is reused and the browser just returns to the dashboard.
+    """
+    account = (case["base_url"], case["email"])
+    try:
+        if account in signed_in_accounts:
+            # Go straight to a signed-in route; the site root only redirects here.
+            # get() returns before the new page commits (page_load_strategy "none")
+            # and the outgoing page has a Create button too, so wait for the old
+            # document to go away before looking for it.
+            outgoing_page = browser.find_element(By.TAG_NAME, "html")
+            browser.get(f"{case['base_url']}{DASHBOARD_PATH}")
+            wait_until_gone(waits.long, outgoing_page)
+            wait_for(waits.long, GLOBAL_CREATE_BUTTON)
+        else:
+            signed_in_accounts.clear()
+            reset_browser(browser)
+            log_in(browser, waits, case)
+            signed_in_accounts.add(account)
+    except Exception:
+        signed_in_accounts.discard(account)
+        browser.save_screenshot(f"{case['test_case']}_failure.png")
+        raise
+    yield browser
+
+@pytest.mark.parametrize("case", [
+    pytest.param(tc, id=tc["test_case"], marks=getattr(pytest.mark, tc["priority"]))
+    for tc in test_cases
+])
+# Hard ceiling per case (login included) so a hung browser cannot stall the run
+@pytest.mark.timeout(120)
+def test_create_jira_issue(logged_in_driver, waits, case):
     """
     Automates Jira issue creation via the web UI.
     Validates that the issue is created with correct details.
     """
-    base_url = case["base_url"]
-    email = case["email"]
-    api_key = case["api_key"]
+    driver = logged_in_driver
     project_key = case["project_key"]
     issue_type = case["issue_type"]
     summary = case["summary"]
     description = case["description"]
 
-    # Step 1: Navigate to Jira login page
-    driver.get(f"{base_url}/login")
+    # Steps 1-4 (login and dashboard) are handled by the logged_in_driver fixture
     try:
-        # Step 2: Enter email and continue
-        email_input = WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.ID, "username"))
-        )
-        email_input.clear()
-        email_input.send_keys(email)
-        driver.find_element(By.ID, "login-submit").click()
-
-        # Step 3: Enter API key as password
-        password_input = WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.ID, "password"))
-        )
-        password_input.clear()
-        password_input.send_keys(api_key)
-        driver.find_element(By.ID, "login-submit").click()
-
-        # Step 4: Wait for dashboard to load
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.ID, "createGlobalItem"))
-        )
-
-        # Step 5: Click 'Create' button
-        driver.find_element(By.ID, "createGlobalItem").click()
+        # Step 5: Click 'Create' button (present, but possibly not yet interactive
+        # while the dashboard finishes loading)
+        wait_for(waits.default, GLOBAL_CREATE_BUTTON, clickable=True).click()
 
         # Step 6: Fill in issue details
-        # Wait for modal
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.ID, "issue-create.ui.modal.create-form.issue-type-select"))
-        )
+        # Wait for modal; the issue type select is its first field, so the
+        # element the wait returns is clicked directly rather than looked up again
+        issue_type_field = wait_for(waits.default, ISSUE_TYPE_SELECT, clickable=True)
 
         # Issue Type
-        issue_type_field = driver.find_element(By.ID, "issue-create.ui.modal.create-form.issue-type-select")
         issue_type_field.click()
-        issue_type_option = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, f"//div[@role='option' and text()='{issue_type}']"))
-        )
+        issue_type_option = wait_for(waits.short, (By.XPATH, DROPDOWN_OPTION_XPATH.format(issue_type)), clickable=True)
         issue_type_option.click()
 
         # Project (if not preselected)
-        project_field = driver.find_element(By.ID, "issue-create.ui.modal.create-form.project-select")
+        project_field = wait_for(waits.short, PROJECT_SELECT, clickable=True)
         if project_field.get_attribute("value") != project_key:
             project_field.click()
-            project_option = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, f"//div[@role='option' and text()='{project_key}']"))
-            )
+            project_option = wait_for(waits.short, (By.XPATH, DROPDOWN_OPTION_XPATH.format(project_key)), clickable=True)
             project_option.click()
 
-        # Summary
-        summary_field = driver.find_element(By.ID, "summary-field")
-        summary_field.clear()
-        summary_field.send_keys(summary)
-
-        # Description
-        description_field = driver.find_element(By.ID, "description-field")
-        description_field.clear()
-        description_field.send_keys(description)
+        # Summary and Description (both filled through JavaScript, so wait until
+        # they are shown rather than just present; checked together each poll)
+        summary_field, description_field = wait_for_visible_ids(waits.short, SUMMARY_FIELD[1], DESCRIPTION_FIELD[1])
+        set_field_values(driver, (summary_field, summary), (description_field, description))
 
         # Step 7: Submit the form
-        create_button = driver.find_element(By.XPATH, "//button[@type='submit' and .='Create']")
+        create_button = wait_for(waits.short, CREATE_SUBMIT, clickable=True)
         create_button.click()
 
-        # Step 8: Assert issue creation
-        confirmation = WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'jira-issue-created')]")
-        )
+        # Step 8: Assert issue creation, once the modal (and its Create button)
+        # has been torn down rather than while the submit is still in flight
+        wait_until_gone(waits.default, create_button)
+        confirmation = wait_for(waits.default, ISSUE_CREATED_BANNER, visible=True)
         assert summary in confirmation.text, f"Issue summary not found in confirmation: {confirmation.text}"
 
-    except Exception as e:
-        # Capture screenshot on failure
+    except Exception:
+        # Capture screenshot on failure, then let the original exception through
+        # so timeouts and driver errors are reported as such, not as assertions
         driver.save_screenshot(f"{case['test_case']}_failure.png")
-        raise AssertionError(f"Test case {case['test_case']} failed: {str(e)}")
+        raise
 
 
 # --- Documentation (README.md) ---
@@ -156,19 +418,63 @@ This suite automates the creation of Jira issues (Story, Task, Bug) via the Jira
 - ChromeDriver (matching your Chrome version)
 - Selenium (`pip install selenium`)
 - PyTest (`pip install pytest`)
+- pytest-xdist (`pip install pytest-xdist`) for parallel runs
+- pytest-timeout (`pip install pytest-timeout`) for the per-case time limit
 
 ## Setup
 1. Clone the repository.
 2. Install dependencies:
    ```
-   pip install selenium pytest
+   pip install -r requirements.txt
    ```
-3. Download and place `chromedriver` in your PATH.
-4. Update the test data in `test_create_jira_issue.py` with valid Jira credentials and project details.
+3. Chrome's driver is resolved by Selenium Manager and cached in `.selenium-cache/`.
+   To use a pre-installed driver instead, set `CHROMEDRIVER=/path/to/chromedriver`.
+   To run against a Selenium Grid or a `selenium/standalone-chrome` container,
+   set `SELENIUM_REMOTE_URL` (e.g. `http://localhost:4444`).
+4. Export your Jira site and credentials:
+   ```
+   export JIRA_BASE_URL=https://your-site.atlassian.net
+   export JIRA_EMAIL=you@example.com
+   export JIRA_API_TOKEN=<api token>
+   ```
+   Project details live in the test data in `AAVAoutput.py`.
 
 ## Running Tests
+The module name does not match pytest's default `test_*.py` pattern, so pass it
+explicitly (a bare `pytest` collects nothing):
+```
+pytest AAVAoutput.py --maxfail=1 --disable-warnings -v
+```
+
+Run only the high-priority cases (e.g. on pull request builds):
+```
+pytest AAVAoutput.py --priority=high
+```
+
+For fast local re-runs, keep one Chrome running and let the suite attach to it
+instead of launching a new browser each time (rejected under `-n`, since all
+workers would share the one browser):
+```
+google-chrome --headless=new --remote-debugging-port=9222 --user-data-dir=/tmp/aava-chrome-debug &
+REUSE_CHROME=1 pytest AAVAoutput.py
+```
+Set `CHROME_DEBUGGER_ADDRESS` if that Chrome listens somewhere other than `127.0.0.1:9222`.
+
+To keep Jira's static assets cached between runs, give Chrome a persistent
+profile directory (one run at a time per directory; each xdist worker uses its
+own subdirectory):
+```
+CHROME_PROFILE_DIR=~/.cache/aava-chrome-profile pytest AAVAoutput.py
+```
+
+Explicit waits poll every 0.1s; on a slow remote grid, poll less often with
+`--poll-frequency=0.5`.
+
+Run the cases in parallel with pytest-xdist (one Chrome per worker, since
+the session-scoped `browser` fixture is instantiated once in each worker and
+chromedriver gives every Chrome its own free DevTools port):
 ```
-pytest test_create_jira_issue.py --maxfail=1 --disable-warnings -v
+pytest AAVAoutput.py -n auto --disable-warnings -v
 ```
 
 ## Output
@@ -228,7 +534,7 @@ pytest test_create_jira_issue.py --maxfail=1 --disable-warnings -v
 1. Environment Setup  
 - Install Python, Chrome, ChromeDriver.
 - Install dependencies via pip.
-- Place `test_create_jira_issue.py` in your test directory.
+- Keep `AAVAoutput.py` next to `conftest.py`, which defines its command-line options.
 
 2. Usage  
 - Edit test data with valid Jira credentials and project info.
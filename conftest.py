@@ -0,0 +1,43 @@
+import os
+
+import pytest
+
+# Priority markers applied to the parametrized test cases
+PRIORITIES = ("high", "medium", "low")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--priority",
+        action="store",
+        default=None,
+        help="Only run test cases with the given priorities, e.g. --priority=high or --priority=high,medium",
+    )
+    parser.addoption(
+        "--poll-frequency",
+        action="store",
+        type=float,
+        default=0.1,
+        help="Seconds between explicit-wait polls (default: 0.1); raise it for slow remote grids",
+    )
+
+
+def pytest_configure(config):
+    for priority in PRIORITIES:
+        config.addinivalue_line("markers", f"{priority}: {priority} priority test case")
+
+    # Translate --priority into a -m expression unless one was given explicitly
+    priority = config.getoption("--priority")
+    if priority and not config.option.markexpr:
+        selected = [p.strip() for p in priority.split(",") if p.strip()]
+        unknown = [p for p in selected if p not in PRIORITIES]
+        if unknown:
+            raise pytest.UsageError(f"--priority: unknown priority {', '.join(unknown)} (expected {', '.join(PRIORITIES)})")
+        config.option.markexpr = " or ".join(selected)
+
+    # REUSE_CHROME attaches to one long-lived Chrome; under xdist every worker
+    # would share it, and each worker's first login clears all its cookies
+    # while the others are mid-test
+    reuse_chrome = os.environ.get("REUSE_CHROME") == "1" and not os.environ.get("SELENIUM_REMOTE_URL")
+    if reuse_chrome and config.getoption("numprocesses", None):
+        raise pytest.UsageError("REUSE_CHROME=1 cannot be used with pytest -n; all workers would share one browser")